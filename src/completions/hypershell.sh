@@ -700,7 +700,7 @@ function _hs_cluster ()
 	local current="${COMP_WORDS[COMP_CWORD]}"
 	local previous="${COMP_WORDS[COMP_CWORD - 1]}"
 	local all_opts="-N --num-tasks -t --template -p --port -b --bundlesize -w --bundlewait
-	-r --max-retries --eager --no-db --initdb --no-confirm --forever --restart --ssh-args --ssh-group
+	-r --max-retries --eager --no-db --initdb --no-confirm --forever --restart --ssh-args --ssh-group --ssh-multiplex
 	-E --env --remote-exe -d --delay-start -c --capture -o --output -e --errors -f --failures
 	-T --timeout -W --task-timeout -A --autoscaling -F --factor -P --period -I --init-size
 	-X --min-size -Y --max-size -h --help"
@@ -30,7 +30,7 @@ Warning:
 
 # type annotations
 from __future__ import annotations
-from typing import List, Tuple, Optional, Callable, Dict, IO, Type, Final
+from typing import List, Tuple, Optional, Callable, Dict, IO, Type, Final, Union
 from types import TracebackType
 
 # standard libs
@@ -41,9 +41,11 @@ import json
 import random
 import functools
 from enum import Enum
+from collections import deque
 from datetime import datetime, timedelta
-from queue import Queue, Empty as QueueEmpty, Full as QueueFull
-from subprocess import Popen, TimeoutExpired
+from queue import Empty as QueueEmpty, Full as QueueFull
+from threading import Event
+from subprocess import Popen
 from socket import gaierror
 from dataclasses import dataclass
 from multiprocessing import AuthenticationError, cpu_count
@@ -62,6 +64,9 @@ from hypershell.core.fsm import State, StateMachine
 from hypershell.core.thread import Thread
 from hypershell.core.signal import check_signal, SIGNAL_MAP, SIGUSR1, SIGUSR2, SIGINT
 from hypershell.core.queue import QueueClient, QueueConfig
+from hypershell.core.ring import RingQueue
+from hypershell.core.steal import StealingQueue
+from hypershell.core.process import ShellPool, ShellProcess, ChildWatcher, SHELL, split_command
 from hypershell.core.logging import HOSTNAME, INSTANCE, Logger
 from hypershell.core.template import Template, DEFAULT_TEMPLATE
 from hypershell.core.exceptions import (handle_exception, handle_disconnect,
@@ -132,10 +137,10 @@ class ClientInfo:
 class SchedulerState(State, Enum):
     """Finite states for scheduler."""
     START = 0
-    GET_REMOTE = 1
-    UNPACK = 2
-    PUT_CONFIRM = 3
-    POP_TASK = 4
+    WAIT_LOCAL = 1
+    GET_REMOTE = 2
+    UNPACK = 3
+    PUT_CONFIRM = 4
     PUT_LOCAL = 5
     FINAL = 6
     HALT = 7
@@ -145,30 +150,29 @@ class ClientScheduler(StateMachine):
     """Receive task bundles from server and schedule locally."""
 
     queue: QueueClient
-    local: Queue[Optional[Task]]
-    bundle: List[bytes]
+    local: StealingQueue[Task]
+    bundle: Optional[bytes]
     client_info: Optional[bytes]
     no_confirm: bool
     timeout: Optional[timedelta]
 
     previous_received: datetime
 
-    task: Task
-    tasks: List[Task]
+    tasks: deque[Task]
 
     state = SchedulerState.START
     states = SchedulerState
 
     def __init__(self: ClientScheduler,
                  queue: QueueClient,
-                 local: Queue[Optional[Task]],
+                 local: StealingQueue[Task],
                  no_confirm: bool = False,
                  timeout: int = None) -> None:
         """Assign remote queue client and local task queue."""
         self.queue = queue
         self.local = local
-        self.bundle = []
-        self.tasks = []
+        self.bundle = b''
+        self.tasks = deque()
         self.client_info = None
         self.no_confirm = no_confirm
         self.timeout = None if not timeout else timedelta(seconds=timeout)
@@ -178,10 +182,10 @@ class ClientScheduler(StateMachine):
     def actions(self: ClientScheduler) -> Dict[SchedulerState, Callable[[], SchedulerState]]:
         return {
             SchedulerState.START: self.start,
+            SchedulerState.WAIT_LOCAL: self.wait_local,
             SchedulerState.GET_REMOTE: self.get_remote,
             SchedulerState.UNPACK: self.unpack_bundle,
             SchedulerState.PUT_CONFIRM: self.put_confirm,
-            SchedulerState.POP_TASK: self.pop_task,
             SchedulerState.PUT_LOCAL: self.put_local,
             SchedulerState.FINAL: self.finalize,
         }
@@ -192,6 +196,15 @@ class ClientScheduler(StateMachine):
         log.debug(f'Started (scheduler: {timeout_label} timeout)')
         return SchedulerState.GET_REMOTE
 
+    def wait_local(self: ClientScheduler) -> SchedulerState:
+        """Wait for local task queue to drain (by half) before requesting more tasks."""
+        # NOTE: Clients pull work from the server; a client with a backlog leaves the next bundle
+        # on the shared queue for whichever client drains its own tasks first
+        if self.local.wait_space((self.local.maxsize + 1) // 2, timeout=1):
+            return SchedulerState.GET_REMOTE
+        else:
+            return SchedulerState.WAIT_LOCAL
+
     def get_remote(self: ClientScheduler) -> SchedulerState:
         """Get the next task bundle from the server."""
         if check_signal() in (SIGUSR1, SIGUSR2) and CLIENT_STANDALONE_MODE:
@@ -202,7 +215,6 @@ class ClientScheduler(StateMachine):
             self.queue.scheduled.task_done()
             self.previous_received = datetime.now()
             if self.bundle is not None:
-                log.debug(f'Received {len(self.bundle)} tasks ({HOSTNAME}: {INSTANCE})')
                 return SchedulerState.UNPACK
             else:
                 log.debug('Disconnect received')
@@ -217,35 +229,31 @@ class ClientScheduler(StateMachine):
 
     def unpack_bundle(self: ClientScheduler) -> SchedulerState:
         """Unpack latest bundle of tasks."""
-        self.tasks = [Task.unpack(data) for data in self.bundle]
+        self.tasks = deque(Task.unpack_many(self.queue.decode(self.bundle)))
+        log.debug(f'Received {len(self.tasks)} tasks ({HOSTNAME}: {INSTANCE})')
         if not self.no_confirm:
             self.client_info = ClientInfo.from_tasks(self.tasks).pack()
             return SchedulerState.PUT_CONFIRM
         else:
-            return SchedulerState.POP_TASK
+            return SchedulerState.PUT_LOCAL
 
     def put_confirm(self: ClientScheduler) -> SchedulerState:
         """Put confirmation details back on remote queue."""
         try:
             self.queue.confirmed.put(self.client_info, timeout=2)
             log.debug(f'Confirmed {len(self.tasks)} tasks ({HOSTNAME}: {INSTANCE})')
-            return SchedulerState.POP_TASK
+            return SchedulerState.PUT_LOCAL
         except QueueFull:
             return SchedulerState.PUT_CONFIRM
 
-    def pop_task(self: ClientScheduler) -> SchedulerState:
-        """Pop next task off current task list."""
-        try:
-            self.task = self.tasks.pop(0)
-            return SchedulerState.PUT_LOCAL
-        except IndexError:
-            return SchedulerState.GET_REMOTE
-
     def put_local(self: ClientScheduler) -> SchedulerState:
-        """Put latest task on the local task queue."""
+        """Put as many remaining tasks from current bundle on the local task queue as will fit."""
+        if not self.tasks:
+            return SchedulerState.WAIT_LOCAL
         try:
-            self.local.put(self.task, timeout=1)
-            return SchedulerState.POP_TASK
+            for _ in range(self.local.put_many(self.tasks, timeout=1)):
+                self.tasks.popleft()
+            return SchedulerState.PUT_LOCAL
         except QueueFull:
             return SchedulerState.PUT_LOCAL
 
@@ -261,7 +269,7 @@ class ClientSchedulerThread(Thread):
 
     def __init__(self: ClientSchedulerThread,
                  queue: QueueClient,
-                 local: Queue[Optional[bytes]],
+                 local: StealingQueue[Task],
                  no_confirm: bool = False,
                  timeout: int = None) -> None:
         """Initialize machine."""
@@ -301,23 +309,23 @@ class ClientCollector(StateMachine):
     """Collect finished tasks and bundle for outgoing queue."""
 
     tasks: List[Task]
-    bundle: List[bytes]
+    bundle: bytes
 
     queue: QueueClient
-    local: Queue[Optional[Task]]
+    local: RingQueue[Optional[Task]]
 
     bundlesize: int
     bundlewait: int
-    previous_send: datetime
+    previous_send: float  # NOTE: monotonic clock
 
     state = CollectorState.START
     states = CollectorState
 
-    def __init__(self: ClientCollector, queue: QueueClient, local: Queue[Optional[Task]],
+    def __init__(self: ClientCollector, queue: QueueClient, local: RingQueue[Optional[Task]],
                  bundlesize: int = DEFAULT_BUNDLESIZE, bundlewait: int = DEFAULT_BUNDLEWAIT) -> None:
         """Collect tasks from local queue of finished tasks and push them to the server."""
         self.tasks = []
-        self.bundle = []
+        self.bundle = b''
         self.local = local
         self.queue = queue
         self.bundlesize = bundlesize
@@ -337,49 +345,47 @@ class ClientCollector(StateMachine):
     def start(self: ClientCollector) -> CollectorState:
         """Jump to GET_LOCAL state."""
         log.debug('Started (collector)')
-        self.previous_send = datetime.now()
+        self.previous_send = time.monotonic()
         return CollectorState.GET_LOCAL
 
     def get_local(self: ClientCollector) -> CollectorState:
-        """Get the next task from the local completed task queue."""
+        """Get available tasks (up to remaining bundle size) from the local completed task queue."""
         try:
-            task = self.local.get(timeout=1)
-            self.local.task_done()
-            if task:
-                self.tasks.append(task)
-                return CollectorState.CHECK_BUNDLE
-            else:
-                return CollectorState.FINAL
+            tasks = self.local.get_many(self.bundlesize - len(self.tasks), timeout=1)
         except QueueEmpty:
             return CollectorState.CHECK_BUNDLE
+        for task in tasks:
+            if task is None:
+                return CollectorState.FINAL
+            self.tasks.append(task)
+        return CollectorState.CHECK_BUNDLE
 
     def check_bundle(self: ClientCollector) -> CollectorState:
         """Check state of task bundle and proceed with return if necessary."""
-        wait_time = (datetime.now() - self.previous_send)
-        since_last = wait_time.total_seconds()
+        since_last = time.monotonic() - self.previous_send
         if len(self.tasks) >= self.bundlesize:
             log.trace(f'Bundle size reached ({len(self.tasks)} tasks)')
             return CollectorState.PACK_BUNDLE
         elif since_last >= self.bundlewait:
-            log.trace(f'Bundle wait exceeded ({wait_time})')
+            log.trace(f'Bundle wait exceeded ({timedelta(seconds=since_last)})')
             return CollectorState.PACK_BUNDLE
         else:
             return CollectorState.GET_LOCAL
 
     def pack_bundle(self: ClientCollector) -> CollectorState:
         """Pack tasks into bundle before pushing back to server."""
-        self.bundle = [task.pack() for task in self.tasks]
+        self.bundle = self.queue.encode(Task.pack_many(self.tasks))
         return CollectorState.PUT_REMOTE
 
     def put_remote(self: ClientCollector) -> CollectorState:
         """Push out bundle of completed tasks."""
         try:
-            if self.bundle:
+            if self.tasks:
                 self.queue.completed.put(self.bundle, timeout=2)
-                log.trace(f'Bundle returned ({len(self.bundle)} tasks)')
+                log.trace(f'Bundle returned ({len(self.tasks)} tasks)')
                 self.tasks.clear()
-                self.bundle.clear()
-                self.previous_send = datetime.now()
+                self.bundle = b''
+                self.previous_send = time.monotonic()
             else:
                 log.trace('Bundle empty')
             return CollectorState.GET_LOCAL
@@ -388,6 +394,7 @@ class ClientCollector(StateMachine):
 
     def finalize(self: ClientCollector) -> CollectorState:
         """Push out any remaining tasks and halt."""
+        self.pack_bundle()
         self.put_remote()
         log.debug('Done (collector)')
         return CollectorState.HALT
@@ -396,7 +403,7 @@ class ClientCollector(StateMachine):
 class ClientCollectorThread(Thread):
     """Run client collector within dedicated thread."""
 
-    def __init__(self: ClientCollectorThread, queue: QueueClient, local: Queue[Optional[bytes]],
+    def __init__(self: ClientCollectorThread, queue: QueueClient, local: RingQueue[Optional[Task]],
                  bundlesize: int = DEFAULT_BUNDLESIZE, bundlewait: int = DEFAULT_BUNDLEWAIT) -> None:
         """Initialize machine."""
         super().__init__(name='hypershell-client-collector')
@@ -417,8 +424,13 @@ DEFAULT_SIGNALWAIT: Final[int] = default.task.signalwait
 """Default signal escalation wait period in seconds."""
 
 
-def task_env(task: Task) -> Dict[str, str]:
-    """Build environment dictionary for the given `task`."""
+def base_env() -> Dict[str, str]:
+    """Build environment dictionary shared by all tasks (see `task_vars` for per-task variables)."""
+    return {**os.environ, **load_task_env()}
+
+
+def task_vars(task: Task) -> Dict[str, str]:
+    """Build task-specific environment variables (TASK_*) for the given `task`."""
     task_data = task.to_json()
     try:
         # We have to flatten tag data separately, otherwise we'd have TASK_TAG='{...}'
@@ -426,8 +438,6 @@ def task_env(task: Task) -> Dict[str, str]:
     except Exception:  # noqa: any exception
         tag_data = {}
     return {
-        **os.environ,
-        **load_task_env(),
         **Namespace.from_dict(task_data).to_env().flatten(prefix='TASK'),
         **tag_data,
         'TASK_CWD': config.task.cwd,
@@ -458,36 +468,44 @@ class TaskExecutor(StateMachine):
 
     id: int
     task: Task
-    process: Popen
+    process: Union[Popen, ShellProcess]
     template: Template
     redirect_output: IO
     redirect_errors: IO
     capture: bool
+    shell_pool: Optional[ShellPool]
+    watcher: Optional[ChildWatcher]
+    exited: Optional[Event]
+    base_env: Dict[str, str]
 
+    started: float
     elapsed: timedelta
     timeout: Optional[int]
     signalwait: int
-    stop_requested: Optional[datetime]
+    stop_requested: Optional[float]
     attempted_sigint: bool
     attempted_sigterm: bool
     attempted_sigkill: bool
 
-    inbound: Queue[Optional[Task]]
-    outbound: Queue[Optional[Task]]
+    inbound: StealingQueue[Task]
+    outbound: RingQueue[Optional[Task]]
+    halted: Event
 
     state = TaskState.START
     states = TaskState
 
     def __init__(self: TaskExecutor,
                  id: int,
-                 inbound: Queue[Optional[Task]],
-                 outbound: Queue[Optional[Task]],
+                 inbound: StealingQueue[Task],
+                 outbound: RingQueue[Optional[Task]],
                  template: str = DEFAULT_TEMPLATE,
                  redirect_output: IO = None,
                  redirect_errors: IO = None,
                  capture: bool = False,
                  timeout: int = None,
-                 signalwait: int = DEFAULT_SIGNALWAIT) -> None:
+                 signalwait: int = DEFAULT_SIGNALWAIT,
+                 shell_pool: ShellPool = None,
+                 watcher: ChildWatcher = None) -> None:
         """Initialize task executor."""
         self.id = id
         self.template = Template(template)
@@ -496,8 +514,13 @@ class TaskExecutor(StateMachine):
         self.redirect_output = redirect_output or sys.stdout
         self.redirect_errors = redirect_errors or sys.stderr
         self.capture = capture
+        self.shell_pool = shell_pool
+        self.watcher = watcher
+        self.exited = None
+        self.base_env = base_env()  # NOTE: copied (not mutated) for each task
         self.timeout = timeout
         self.signalwait = signalwait
+        self.halted = Event()
 
     @functools.cached_property
     def actions(self: TaskExecutor) -> Dict[TaskState, Callable[[], TaskState]]:
@@ -517,15 +540,16 @@ class TaskExecutor(StateMachine):
         }
 
     def start(self: TaskExecutor) -> TaskState:
-        """Jump to GET_LOCAL state."""
+        """Warmup shell worker (if enabled) and jump to GET_LOCAL state."""
+        if self.shell_pool:
+            self.shell_pool.warmup()
         log.debug(f'Started (executor-{self.id})')
         return TaskState.GET_LOCAL
 
     def get_local(self: TaskExecutor) -> TaskState:
         """Get the next task from the local queue of new tasks."""
         try:
-            self.task = self.inbound.get(timeout=1)
-            self.inbound.task_done()
+            self.task = self.inbound.get(worker=self.id - 1, timeout=1)
             return TaskState.CREATE_TASK if self.task else TaskState.FINAL
         except QueueEmpty:
             return TaskState.GET_LOCAL
@@ -539,8 +563,7 @@ class TaskExecutor(StateMachine):
             return TaskState.START_TASK
         except Exception as error:
             log.error(f'{error.__class__.__name__}: {error}')
-            self.task.start_time = datetime.now().astimezone()
-            self.task.completion_time = datetime.now().astimezone()
+            self.task.start_time = self.task.completion_time = datetime.now().astimezone()
             self.task.exit_status = -1
             return TaskState.PUT_LOCAL
 
@@ -549,73 +572,121 @@ class TaskExecutor(StateMachine):
         # NOTE: enforce tz aware submit_time (in case of sqlite backend)
         self.task.start_time = datetime.now().astimezone()
         self.task.waited = int((self.task.start_time - self.task.submit_time.astimezone()).total_seconds())
-        env = task_env(self.task)
+        self.started = time.monotonic()  # NOTE: elapsed time and signal escalation use monotonic clock
+        env = task_vars(self.task)
         if self.capture:
             self.task.outpath = env['TASK_OUTPATH']
             self.task.errpath = env['TASK_ERRPATH']
-            self.redirect_output = open(self.task.outpath, mode='w')
-            self.redirect_errors = open(self.task.errpath, mode='w')
         self.stop_requested = None
         self.attempted_sigint = False
         self.attempted_sigterm = False
         self.attempted_sigkill = False
-        self.process = Popen(self.task.command, shell=True,
-                             stdout=self.redirect_output, stderr=self.redirect_errors,
-                             cwd=config.task.cwd, env=env)
+        if self.shell_pool:
+            self.process = self.shell_pool.run(self.task.command, env=env,
+                                               outpath=self.task.outpath, errpath=self.task.errpath)
+        else:
+            if self.capture:
+                self.redirect_output = open(self.task.outpath, mode='w')
+                self.redirect_errors = open(self.task.errpath, mode='w')
+            self.process = self.spawn(self.task.command, env={**self.base_env, **env})
+            if self.watcher:
+                self.exited = self.watcher.register(self.process.pid)
         log.info(f'Running task ({self.task.id})')
         log.debug(f'Running task ({self.task.id}: {self.task.command})')
         log.trace(f'Running task ({self.task.id}: pid={self.process.pid}, argv={self.task.command})')
         return TaskState.WAIT_TASK
 
+    def spawn(self: TaskExecutor, command: str, env: Dict[str, str]) -> Popen:
+        """Start `command` directly if it is a simple command, otherwise within a shell."""
+        options = dict(stdout=self.redirect_output, stderr=self.redirect_errors, cwd=config.task.cwd, env=env)
+        if direct := split_command(command, path=env.get('PATH')):
+            executable, argv = direct
+            try:
+                return Popen(argv, executable=executable, **options)
+            except OSError:
+                pass  # NOTE: let the shell report the failure as usual
+        return Popen(command, shell=True, **options)
+
     def wait_task(self: TaskExecutor) -> TaskState:
         """Wait for current task to complete."""
-        try:
-            self.task.exit_status = self.process.wait(timeout=1)
+        if (exit_status := self.poll_task(timeout=1)) is not None:
+            self.task.exit_status = exit_status
             self.task.completion_time = datetime.now().astimezone()
-            self.task.duration = int((self.task.completion_time - self.task.start_time).total_seconds())
+            self.task.duration = int(time.monotonic() - self.started)
             log.debug(f'Completed task ({self.task.id})')
-            if self.capture:
+            if self.capture and not self.shell_pool:
                 self.redirect_output.close()
                 self.redirect_errors.close()
             return TaskState.PUT_LOCAL
-        except TimeoutExpired:
+        else:
             # Only display time elapsed to the nearest second
-            self.elapsed = timedelta(seconds=round((datetime.now().astimezone() -
-                                                    self.task.start_time).total_seconds()))
+            self.elapsed = timedelta(seconds=round(time.monotonic() - self.started))
             log.trace(f'Waiting on task ({self.task.id}: {self.elapsed})')
             if self.stop_requested:
                 return TaskState.WAIT_SIGNAL
             else:
                 return TaskState.CHECK_TASK
 
+    def poll_task(self: TaskExecutor, timeout: float) -> Optional[int]:
+        """Poll current task process until it exits or `timeout` expires (returns early if halted)."""
+        if self.shell_pool:
+            # NOTE: shell workers report exit status over a pipe we can block on directly
+            return self.poll_shell(timeout)
+        if self.exited:
+            return self.poll_exited(timeout)
+        deadline = time.monotonic() + timeout
+        delay = 0.0005
+        while (exit_status := self.process.poll()) is None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or self.halted.wait(min(delay, remaining)):
+                break
+            delay = min(2 * delay, 0.05)
+        return exit_status
+
+    def poll_shell(self: TaskExecutor, timeout: float) -> Optional[int]:
+        """Wait on current task from shell worker in short intervals (returns early if halted)."""
+        deadline = time.monotonic() + timeout
+        while (remaining := deadline - time.monotonic()) > 0 and not self.halted.is_set():
+            if (exit_status := self.process.poll(timeout=min(0.1, remaining))) is not None:
+                return exit_status
+        return self.process.poll()
+
+    def poll_exited(self: TaskExecutor, timeout: float) -> Optional[int]:
+        """Wait for exit notification from child watcher in short intervals (returns early if halted)."""
+        deadline = time.monotonic() + timeout
+        while (remaining := deadline - time.monotonic()) > 0 and not self.halted.is_set():
+            if self.exited.wait(min(0.1, remaining)):
+                break
+        return self.process.poll()
+
     def check_task(self: TaskExecutor) -> TaskState:
         """Check for timeout or interrupts."""
         if check_signal() == SIGUSR2:  # NOTE: regardless of CLIENT_STANDALONE_MODE
             log.warning(f'Signal interrupt (SIGUSR2: executor-{self.id})')
-            self.stop_requested = datetime.now()
+            self.stop_requested = time.monotonic()
             return TaskState.WAIT_SIGNAL
         elif self.timeout is None or self.elapsed.total_seconds() < self.timeout:
             return TaskState.WAIT_TASK
         else:
             log.warning(f'Task exceeded walltime limit ({self.elapsed})')
-            self.stop_requested = datetime.now()
+            self.stop_requested = time.monotonic()
             return TaskState.WAIT_SIGNAL
 
     def wait_signal(self: TaskExecutor) -> TaskState:
         """Wait on interrupts."""
         if self.attempted_sigint is False:
             return TaskState.STOP_TASK
-        elif (datetime.now() - self.stop_requested).total_seconds() < 1 * self.signalwait:
+        elif time.monotonic() - self.stop_requested < 1 * self.signalwait:
             return TaskState.WAIT_TASK
         elif self.attempted_sigterm is False:
             log.error(f'Interrupt ignored ({self.task.id})')
             return TaskState.TERM_TASK
-        elif (datetime.now() - self.stop_requested).total_seconds() < 2 * self.signalwait:
+        elif time.monotonic() - self.stop_requested < 2 * self.signalwait:
             return TaskState.WAIT_TASK
         elif self.attempted_sigkill is False:
             log.error(f'Terminate ignored ({self.task.id})')
             return TaskState.KILL_TASK
-        elif (datetime.now() - self.stop_requested).total_seconds() < 3 * self.signalwait:
+        elif time.monotonic() - self.stop_requested < 3 * self.signalwait:
             return TaskState.WAIT_TASK
         else:
             log.critical(f'Process ignored SIGKILL ({self.task.id}: {self.process.pid})')
@@ -660,6 +731,11 @@ class TaskExecutor(StateMachine):
             self.redirect_errors.close()
         return TaskState.HALT
 
+    def halt(self: TaskExecutor) -> None:
+        """Set flag to signal for termination and interrupt any wait on the current task."""
+        super().halt()
+        self.halted.set()
+
 
 class TaskThread(Thread):
     """Run task executor within dedicated thread."""
@@ -668,20 +744,23 @@ class TaskThread(Thread):
 
     def __init__(self: TaskThread,
                  id: int,
-                 inbound: Queue[Optional[str]],
-                 outbound: Queue[Optional[str]],
+                 inbound: StealingQueue[Task],
+                 outbound: RingQueue[Optional[Task]],
                  template: str = DEFAULT_TEMPLATE,
                  capture: bool = False,
                  redirect_output: IO = None,
                  redirect_errors: IO = None,
                  timeout: int = None,
-                 signalwait: int = DEFAULT_SIGNALWAIT) -> None:
+                 signalwait: int = DEFAULT_SIGNALWAIT,
+                 shell_pool: ShellPool = None,
+                 watcher: ChildWatcher = None) -> None:
         """Initialize task executor."""
         self.id = id
         super().__init__(name=f'hypershell-executor-{id}')
         self.machine = TaskExecutor(id=id, inbound=inbound, outbound=outbound, template=template,
                                     redirect_output=redirect_output, redirect_errors=redirect_errors,
-                                    capture=capture, timeout=timeout, signalwait=signalwait)
+                                    capture=capture, timeout=timeout, signalwait=signalwait,
+                                    shell_pool=shell_pool, watcher=watcher)
 
     def run_with_exceptions(self: TaskThread) -> None:
         """Run machine."""
@@ -893,11 +972,14 @@ class ClientThread(Thread):
     delay_start: float
     no_confirm: bool
 
-    inbound: Queue[Optional[Task]]
-    outbound: Queue[Optional[Task]]
+    inbound: StealingQueue[Task]
+    outbound: RingQueue[Optional[Task]]
     scheduler: ClientSchedulerThread
     collector: ClientCollectorThread
     executors: List[TaskThread]
+    shell_pool: Optional[ShellPool]
+    watcher: Optional[ChildWatcher]
+    task_signalwait: int
 
     def __init__(self: ClientThread,
                  num_tasks: int = DEFAULT_NUM_TASKS,
@@ -920,31 +1002,50 @@ class ClientThread(Thread):
         self.num_tasks = num_tasks
         self.delay_start = delay_start
         self.no_confirm = no_confirm
-        self.client = QueueClient(config=QueueConfig(host=address[0], port=address[1], auth=auth))
-        self.inbound = Queue(maxsize=bundlesize)
-        self.outbound = Queue(maxsize=bundlesize)
+        self.task_signalwait = task_signalwait
+        self.client = QueueClient(config=QueueConfig(host=address[0], port=address[1], auth=auth,
+                                                     compress=config.client.compress))
+        self.inbound = StealingQueue(workers=num_tasks, maxsize=bundlesize)
+        self.outbound = RingQueue(maxsize=bundlesize)
         self.scheduler = ClientSchedulerThread(queue=self.client, local=self.inbound,
                                                no_confirm=no_confirm, timeout=client_timeout)
         self.heartbeat = ClientHeartbeatThread(queue=self.client, heartrate=heartrate)
         self.collector = ClientCollectorThread(queue=self.client, local=self.outbound,
                                                bundlesize=bundlesize, bundlewait=bundlewait)
+        self.shell_pool = self.new_shell_pool(redirect_output, redirect_errors)
+        self.watcher = ChildWatcher() if not self.shell_pool and ChildWatcher.supported() else None
         self.executors = [TaskThread(id=count+1,
                                      inbound=self.inbound, outbound=self.outbound,
                                      redirect_output=redirect_output, redirect_errors=redirect_errors,
                                      template=template, capture=capture, timeout=task_timeout,
-                                     signalwait=task_signalwait)
+                                     signalwait=task_signalwait, shell_pool=self.shell_pool,
+                                     watcher=self.watcher)
                           for count in range(num_tasks)]
 
+    @staticmethod
+    def new_shell_pool(redirect_output: Optional[IO], redirect_errors: Optional[IO]) -> Optional[ShellPool]:
+        """Initialize shell pool for executors if enabled by `task.shellpool`."""
+        if not config.task.shellpool:
+            return None
+        if SHELL is None:
+            log.warning('Shell pool not supported on this platform (requires bash)')
+            return None
+        return ShellPool(stdout=redirect_output, stderr=redirect_errors,
+                         env=base_env(), cwd=config.task.cwd)
+
     def run_with_exceptions(self: ClientThread) -> None:
         """Start child threads, wait."""
         log.debug(f'Started ({self.num_tasks} executors)')
         self.wait_start()
-        with self.client:
-            self.start_threads()
-            self.wait_scheduler()
-            self.wait_executors()
-            self.wait_collector()
-            self.wait_heartbeat()
+        try:
+            with self.client:
+                self.start_threads()
+                self.wait_scheduler()
+                self.wait_executors()
+                self.wait_collector()
+                self.wait_heartbeat()
+        finally:
+            self.stop_processes()
         log.debug('Done')
 
     def wait_start(self: ClientThread) -> None:
@@ -960,12 +1061,12 @@ class ClientThread(Thread):
             time.sleep(delay)
 
     def start_threads(self: ClientThread) -> None:
-        """Start child threads."""
+        """Start child threads (executors first to overlap their startup with initial scheduling)."""
+        for executor in self.executors:
+            executor.start()
         self.scheduler.start()
         self.collector.start()
         self.heartbeat.start()
-        for executor in self.executors:
-            executor.start()
 
     def wait_scheduler(self: ClientThread) -> None:
         """Wait for all tasks to be completed."""
@@ -980,8 +1081,7 @@ class ClientThread(Thread):
 
     def wait_executors(self: ClientThread) -> None:
         """Send disconnect signal to each task executor thread."""
-        for _ in self.executors:
-            self.inbound.put(None)  # signal executors to shut down
+        self.inbound.close()  # signal executors to shut down once drained
         for thread in self.executors:
             log.trace(f'Waiting (executor-{thread.id})')
             thread.join()
@@ -992,11 +1092,19 @@ class ClientThread(Thread):
         self.heartbeat.signal_finished()
         self.heartbeat.join()
 
+    def stop_processes(self: ClientThread) -> None:
+        """Terminate tasks left running on the shell pool (own process groups) and stop watcher."""
+        if self.shell_pool:
+            self.shell_pool.close(signalwait=self.task_signalwait)
+        if self.watcher:
+            self.watcher.stop()
+
     def stop(self: ClientThread, wait: bool = False, timeout: int = None) -> None:
         """Stop child threads before main thread."""
         log.warning('Stopping')
         self.scheduler.stop(wait=wait, timeout=timeout)
         self.collector.stop(wait=wait, timeout=timeout)
+        self.stop_processes()
         super().stop(wait=wait, timeout=timeout)
 
 
@@ -1100,8 +1208,8 @@ def run_client(num_tasks: int = DEFAULT_NUM_TASKS,
                               task_signalwait=task_signalwait)
     try:
         thread.join()
-    except Exception:
-        thread.stop()
+    except (Exception, KeyboardInterrupt):
+        thread.stop()  # NOTE: also terminates tasks left running on the shell pool
         raise
 
 
@@ -51,7 +51,7 @@ APP_USAGE = """\
 Usage:
   hs cluster [-h] [FILE | --restart | --forever] [-N NUM] [-t CMD] [-b SIZE] [-w SEC]
              [-p PORT] [-r NUM [--eager]] [-f PATH] [--capture | [-o PATH] [-e PATH]]
-             [--ssh [HOST... | --ssh-group NAME] [--env] | --mpi | --launcher=ARGS...]
+             [--ssh [HOST... | --ssh-group NAME] [--env] [--ssh-multiplex] | --mpi | --launcher=ARGS...]
              [--no-db | --initdb] [--no-confirm] [-d SEC] [-T SEC] [-W SEC] [-S SEC]
              [--autoscaling [MODE] [-P SEC] [-F VALUE] [-I NUM] [-X NUM] [-Y NUM]]
 
@@ -84,6 +84,7 @@ Options:
       --restart                Start scheduling from last completed task.
       --ssh-args      ARGS     Command-line arguments for SSH.
       --ssh-group     NAME     SSH nodelist group in config.
+      --ssh-multiplex          Share one SSH connection per host.
   -E, --env                    Send environment variables.
       --remote-exe    PATH     Path to executable on remote hosts.
   -d, --delay-start   SEC      Delay time for launching clients (default: {DEFAULT_DELAY}).
@@ -162,6 +163,9 @@ class ClusterApp(Application):
     ssh_group: str = None
     interface.add_argument('--ssh-group', default=None)
 
+    ssh_multiplex: bool = False
+    interface.add_argument('--ssh-multiplex', action='store_true')
+
     remote_exe: str = sys.argv[0]
     interface.add_argument('--remote-exe', default=remote_exe)
 
@@ -239,7 +243,8 @@ class ClusterApp(Application):
         else:
             nodelist = NodeList.from_cmdline(self.ssh_mode if self.ssh_mode != '<default>' else None)
         run_ssh(**options, launcher='ssh', launcher_args=shlex.split(self.ssh_args), nodelist=nodelist,
-                remote_exe=self.remote_exe, bind=('0.0.0.0', self.port), export_env=self.export_env)
+                remote_exe=self.remote_exe, bind=('0.0.0.0', self.port), export_env=self.export_env,
+                multiplex=self.ssh_multiplex)
 
     def run_autoscaling(self: ClusterApp, **options) -> None:
         """Run remote cluster with custom launcher and autoscaling."""
@@ -294,6 +299,8 @@ class ClusterApp(Application):
             raise ArgumentError('Using --forever with --restart is invalid')
         if self.ssh_args and not self.ssh_mode:
             raise ArgumentError('Unexpected --ssh-args when not in --ssh mode')
+        if self.ssh_multiplex and not self.ssh_mode:
+            raise ArgumentError('Unexpected --ssh-multiplex when not in --ssh mode')
         if self.ssh_group and self.ssh_mode != '<default>':
             raise ArgumentError('Cannot specify --ssh with target with --ssh-group')
         if self.autoscaling_policy is not None and self.ssh_mode:
@@ -9,7 +9,6 @@ from __future__ import annotations
 from typing import Iterable, IO
 
 # standard libs
-import time
 import secrets
 
 # internal libs
@@ -45,8 +44,8 @@ def run_local(**options) -> None:
     thread = LocalCluster.new(**options)
     try:
         thread.join()
-    except Exception:
-        thread.stop()
+    except (Exception, KeyboardInterrupt):
+        thread.stop()  # NOTE: also terminates tasks left running on the shell pool
         raise
 
 
@@ -197,7 +196,7 @@ class LocalCluster(Thread):
         """Start child threads, wait."""
         set_client_standalone(False)
         self.server.start()
-        time.sleep(2)  # NOTE: give the server a chance to start
+        self.server.wait_ready()
         self.client.start()
         self.client.join()
         self.server.join()
@@ -247,7 +247,7 @@ class RemoteCluster(Thread):
     def run_with_exceptions(self: RemoteCluster) -> None:
         """Start child threads, wait."""
         self.server.start()
-        time.sleep(2)  # NOTE: give the server a chance to start
+        self.server.wait_ready()
         log.debug(f'Launching clients: {self.client_argv}')
         self.clients = Popen(self.client_argv,
                              stdout=sys.stdout, stderr=sys.stderr,
@@ -707,7 +707,7 @@ class AutoScalingCluster(Thread):
     def run_with_exceptions(self: AutoScalingCluster) -> None:
         """Start child threads, wait."""
         self.server.start()
-        time.sleep(2)  # NOTE: give the server a chance to start
+        self.server.wait_ready()
         self.autoscaler.start()
         self.autoscaler.join()
         self.server.join()
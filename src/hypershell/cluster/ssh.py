@@ -6,15 +6,19 @@
 
 # type annotations
 from __future__ import annotations
-from typing import Type, List, Iterable, Tuple, IO, Final
+from typing import Type, List, Iterable, Tuple, IO, Optional, Final
 
 # standard libs
 import re
+import os
 import sys
-import time
 import shlex
+import shutil
 import secrets
-from subprocess import Popen
+import tempfile
+from collections import Counter
+from subprocess import Popen, DEVNULL
+from concurrent.futures import ThreadPoolExecutor
 
 # external libs
 from cmdkit.config import ConfigurationError, Namespace
@@ -78,6 +82,8 @@ class SSHCluster(Thread):
 
         nodelist (List[str], required):
             List of hostnames for launching clients.
+            A hostname listed more than once results in a single client on that host
+            with `num_tasks` executors for each occurrence.
             See also: :class:`~hypershell.cluster.ssh.NodeList`.
 
         num_tasks (int, optional):
@@ -115,6 +121,11 @@ class SSHCluster(Thread):
             If enabled, embed local configuration as environment variables
             and forward with client launch command to remote hosts.
 
+        multiplex (bool, optional):
+            If enabled, establish a single SSH master connection per unique host
+            and route client launches through its control socket.
+            Defaults to `False`.
+
         in_memory (bool, optional):
             If True, revert to basic in-memory queue.
 
@@ -178,6 +189,9 @@ class SSHCluster(Thread):
     server: ServerThread
     clients: List[Popen]
     client_argv: List[List[str]]
+    hosts: List[str]
+    launcher: List[str]
+    control_path: Optional[str]
 
     def __init__(self: SSHCluster,
                  source: Iterable[str] = None,
@@ -191,6 +205,7 @@ class SSHCluster(Thread):
                  launcher_args: List[str] = None,
                  remote_exe: str = DEFAULT_REMOTE_EXE,
                  export_env: bool = False,
+                 multiplex: bool = False,
                  in_memory: bool = False,
                  no_confirm: bool = False,
                  forever_mode: bool = False,
@@ -220,6 +235,7 @@ class SSHCluster(Thread):
                                    restart_mode=restart_mode,
                                    redirect_failures=redirect_failures)
         launcher = shlex.split(launcher)
+        launcher[0] = shutil.which(launcher[0]) or launcher[0]  # NOTE: avoid PATH search per launch
         launcher_env = shlex.split('' if not export_env else compile_env())
         if launcher_args is None:
             launcher_args = shlex.split(config.ssh.get('args', ''))
@@ -232,32 +248,97 @@ class SSHCluster(Thread):
             client_args.extend(['-T', str(client_timeout)])
         if task_timeout is not None:
             client_args.extend(['-W', str(task_timeout)])
+        host_count = Counter(nodelist)  # NOTE: preserves order of first appearance
+        self.hosts = list(host_count)
+        self.launcher = [*launcher, *launcher_args]
+        self.control_path = None
+        control_args = []
+        if multiplex:
+            # NOTE: %C is a 40 character hash of the connection details and ssh appends another
+            # 17 characters while creating the socket, so use /tmp rather than $TMPDIR (which on macOS
+            # is long enough to exceed the 104 byte limit on socket paths)
+            tmpdir = '/tmp' if os.path.isdir('/tmp') else tempfile.gettempdir()
+            self.control_path = os.path.join(tmpdir, f'hs-{secrets.token_hex(4)}-%C')
+            control_args = ['-S', self.control_path]
         self.client_argv = [
-            [*launcher, *launcher_args, host, *launcher_env, remote_exe, 'client', '-H', HOSTNAME,
-             '-p', str(bind[1]), '-N', str(num_tasks), '-b', str(bundlesize), '-w', str(bundlewait),
+            [*self.launcher, *control_args, host, *launcher_env, remote_exe, 'client', '-H', HOSTNAME,
+             '-p', str(bind[1]), '-N', str(num_tasks * count), '-b', str(bundlesize), '-w', str(bundlewait),
              '-t', f'\'{template}\'', '-k', auth, '-d', str(delay_start),
              '-S', str(task_signalwait), *client_args]
-            for host in nodelist
+            for host, count in host_count.items()
         ]
+        self.clients = []
         super().__init__(name='hypershell-cluster')
 
     def run_with_exceptions(self: SSHCluster) -> None:
         """Start child threads, wait."""
         self.server.start()
-        time.sleep(2)  # NOTE: give the server a chance to start
-        self.clients = []
-        for argv in self.client_argv:
-            log.debug(f'Launching client: {argv}')
-            self.clients.append(Popen(argv, stdout=sys.stdout, stderr=sys.stderr))
-        for client in self.clients:
-            client.wait()
-        self.server.join()
+        self.server.wait_ready()
+        try:
+            self.start_masters()
+            log.debug(f'Launching clients ({len(self.hosts)} hosts)')
+            for argv in self.client_argv:
+                log.debug(f'Launching client: {argv}')
+            self.launch(self.client_argv, self.clients, stdout=sys.stdout, stderr=sys.stderr)
+            for client in self.clients:
+                client.wait()
+            self.server.join()
+        finally:
+            self.stop_masters()
+
+    def start_masters(self: SSHCluster) -> None:
+        """Establish one master connection per unique host if multiplexing."""
+        if not self.control_path:
+            return
+        log.debug(f'Starting SSH master connections ({len(self.hosts)} hosts)')
+        master_argv = [[*self.launcher, '-fNM', '-S', self.control_path, '-o', 'ControlPersist=300', host]
+                       for host in self.hosts]
+        for argv in master_argv:
+            log.trace(f'Starting SSH master: {argv}')
+        masters = self.launch(master_argv, stdout=DEVNULL, stderr=sys.stderr)
+        # NOTE: with -f the master backgrounds itself once authenticated
+        for host, master in zip(self.hosts, masters):
+            if (status := master.wait()) != 0:
+                log.warning(f'SSH master connection failed ({host}: exit status {status})')
+
+    def stop_masters(self: SSHCluster) -> None:
+        """Tear down master connections if multiplexing."""
+        if not self.control_path:
+            return
+        log.debug(f'Stopping SSH master connections ({len(self.hosts)} hosts)')
+        masters = self.launch([[*self.launcher, '-S', self.control_path, '-O', 'exit', host]
+                               for host in self.hosts], stdout=DEVNULL, stderr=DEVNULL)
+        for master in masters:
+            master.wait()
+
+    @staticmethod
+    def launch(argv_list: List[List[str]], processes: List[Popen] = None, **options) -> List[Popen]:
+        """
+        Start processes for each of `argv_list` concurrently (launch cost overlaps for many hosts).
+        Each process is appended to `processes` (in order) once started, so those already running
+        can still be stopped if another fails to launch. The first error is raised after all attempts.
+        """
+        processes = [] if processes is None else processes
+        if not argv_list:
+            return processes
+        error = None
+        with ThreadPoolExecutor(max_workers=min(len(argv_list), 32)) as pool:
+            futures = [pool.submit(Popen, argv, **options) for argv in argv_list]
+            for future in futures:
+                try:
+                    processes.append(future.result())
+                except Exception as exc:
+                    error = error or exc
+        if error is not None:
+            raise error
+        return processes
 
     def stop(self: SSHCluster, wait: bool = False, timeout: int = None) -> None:
         """Stop child threads before main thread."""
         self.server.stop(wait=wait, timeout=timeout)
         for client in self.clients:
             client.terminate()
+        self.stop_masters()
         super().stop(wait=wait, timeout=timeout)
 
 
@@ -79,6 +79,7 @@ default = Namespace({
         'cwd': os.getcwd(),
         'timeout': None,    # seconds, period to wait before killing tasks
         'signalwait': 10,   # seconds to wait between signal escalation (INT, TERM, KILL)
+        'shellpool': False, # launch tasks from persistent shell workers (requires bash)
     },
 
     'submit': {
@@ -97,6 +98,7 @@ default = Namespace({
         'eager': False,     # prefer failed tasks to new tasks
         'wait': 5,          # seconds to wait between database queries
         'evict': 600,       # assume client is gone if no heartbeat after this many seconds
+        'compress': False,  # compress task bundles sent to clients
     },
 
     'client': {
@@ -104,6 +106,7 @@ default = Namespace({
         'bundlewait': 5,    # seconds to wait before returning regardless of size
         'heartrate': 10,    # seconds to wait between heartbeats
         'timeout': None,    # seconds to wait for bundle from server before shutting down
+        'compress': False,  # compress task bundles returned to server
     },
 
     'ssh': {
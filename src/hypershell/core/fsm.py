@@ -59,8 +59,17 @@ class StateMachine(ABC):
 
     def run(self) -> None:
         """Run machine until state is set to `HALT`."""
-        while self.state is not self.states.HALT:  # noqa: HALT defined in implemented State enums
-            self.state = self.next()
+        # NOTE: Equivalent to calling `next` in a loop but with the lookups hoisted out of it,
+        # the actions table is fixed for the lifetime of the machine
+        actions = self.actions
+        halt = self.states.HALT  # noqa: HALT defined in implemented State enums
+        try:
+            while self.state is not halt:
+                self.state = halt if self.__should_halt else actions[self.state]()
+        except Exception as error:
+            log.critical(f'Uncaught exception from {self.__class__}')
+            write_traceback(error, logger=log, module=__name__)
+            raise
 
     def halt(self) -> None:
         """Set flag to signal for termination."""
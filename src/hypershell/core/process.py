@@ -0,0 +1,453 @@
+# SPDX-FileCopyrightText: 2024 Geoffrey Lentner
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Persistent shell workers for launching task processes.
+
+A :class:`ShellWorker` is a long-running `bash` process reading commands on <stdin>.
+Each task is started as a background job of the worker (a `fork` of an already running
+shell rather than a new `fork+exec` of `/bin/sh`). The worker reports the job's PID and
+final exit status over a dedicated pipe. Tasks are represented by a :class:`ShellProcess`,
+which implements the subset of the :class:`subprocess.Popen` interface used by executors.
+
+Example:
+    >>> from hypershell.core.process import ShellPool
+    >>> pool = ShellPool()
+    >>> process = pool.run('echo hello', env={'TASK_ID': '...'})
+    >>> process.wait()
+    0
+
+A :class:`ChildWatcher` waits on many child processes at once from a single thread (Linux only)
+and sets an event for each as it exits, so executors need not poll their own processes.
+"""
+
+
+# type annotations
+from __future__ import annotations
+from typing import Dict, List, IO, Optional, Set, Tuple, Final
+
+# standard libs
+import os
+import re
+import sys
+import time
+import shlex
+import shutil
+import select
+import functools
+from threading import Lock, Event, Thread
+from subprocess import Popen, PIPE, DEVNULL, TimeoutExpired
+from signal import SIGTERM, SIGKILL
+
+# internal libs
+from hypershell.core.logging import Logger
+
+# public interface
+__all__ = ['ShellPool', 'ShellWorker', 'ShellProcess', 'SHELL', 'ChildWatcher', 'split_command']
+
+# initialize logger
+log = Logger.with_name(__name__)
+
+
+SHELL: Final[Optional[str]] = shutil.which('bash') if os.name == 'posix' else None
+"""Path to shell executable for workers (not available on non-POSIX platforms)."""
+
+
+# NOTE: only valid shell identifiers can be exported (e.g., tag names with dashes are dropped)
+VALID_NAME: Final[re.Pattern] = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
+# Characters with special meaning to the shell (expansion, redirection, control, escapes)
+SHELL_SYNTAX: Final[re.Pattern] = re.compile(r'[|&;<>()$`\\*?\[\]{}~#!\n]')
+
+# Shell builtins that may also exist as programs on PATH but behave differently (e.g., `echo -e`, `pwd`)
+SHELL_BUILTINS: Final[frozenset] = frozenset([
+    '.', ':', '[', 'alias', 'bg', 'cd', 'command', 'echo', 'eval', 'exec', 'exit', 'export', 'false',
+    'fg', 'getopts', 'hash', 'jobs', 'kill', 'printf', 'pwd', 'read', 'set', 'shift', 'source', 'test',
+    'time', 'times', 'trap', 'true', 'type', 'ulimit', 'umask', 'unalias', 'unset', 'wait',
+])
+
+
+def split_command(command: str, path: str = None) -> Optional[Tuple[str, List[str]]]:
+    """
+    Split `command` for direct execution if it is a simple command without shell syntax.
+    Returns the resolved executable and the argument list, or None if a shell is required
+    (i.e., shell syntax, a variable assignment, a builtin, or a program not found on `path`).
+    """
+    if SHELL_SYNTAX.search(command):
+        return None
+    try:
+        argv = shlex.split(command)
+    except ValueError:
+        return None
+    if not argv or argv[0] in SHELL_BUILTINS or '=' in argv[0] or '/' in argv[0]:
+        return None
+    if (executable := find_executable(argv[0], path)) is None:
+        return None
+    return executable, argv
+
+
+@functools.lru_cache(maxsize=None)
+def find_executable(name: str, path: str = None) -> Optional[str]:
+    """Absolute path to program `name` on `path` or None if not found."""
+    executable = shutil.which(name, path=path)
+    return executable if executable and os.path.isabs(executable) else None
+
+
+class ShellProcess:
+    """Handle on a task started by a :class:`ShellWorker` (similar to :class:`subprocess.Popen`)."""
+
+    pid: int
+    returncode: Optional[int]
+
+    worker: ShellWorker
+    signals: Set[int]
+
+    def __init__(self: ShellProcess, worker: ShellWorker, pid: int) -> None:
+        """Initialize with `worker` running the task as job `pid`."""
+        self.worker = worker
+        self.pid = pid
+        self.returncode = None
+        self.signals = set()
+
+    def poll(self: ShellProcess, timeout: float = 0) -> Optional[int]:
+        """Check if task has completed (waiting up to `timeout` seconds) and return exit status."""
+        if self.returncode is None:
+            try:
+                status = self.worker.read_status(timeout=timeout)
+            except RuntimeError as error:
+                log.error(str(error))
+                self.returncode = -1
+                return self.returncode
+            if status is not None:
+                # NOTE: the shell reports 128+N for jobs killed by signal N
+                if status > 128 and (status - 128) in self.signals:
+                    status = 128 - status
+                self.returncode = status
+                self.worker.release()
+        return self.returncode
+
+    def wait(self: ShellProcess, timeout: float = None) -> int:
+        """Wait for task to complete and return exit status."""
+        if self.poll(timeout=timeout) is None:
+            raise TimeoutError(f'Task did not complete in {timeout} seconds (pid={self.pid})')
+        return self.returncode
+
+    def send_signal(self: ShellProcess, signum: int) -> None:
+        """Send signal to task process group."""
+        if self.returncode is None:
+            self.signals.add(signum)
+            try:
+                os.killpg(self.pid, signum)
+            except ProcessLookupError:
+                pass
+
+    def terminate(self: ShellProcess) -> None:
+        """Send SIGTERM to task process group."""
+        self.send_signal(SIGTERM)
+
+    def kill(self: ShellProcess) -> None:
+        """Send SIGKILL to task process group."""
+        self.send_signal(SIGKILL)
+
+
+class ShellWorker:
+    """
+    Persistent shell process for launching tasks.
+
+    The shell runs with job control enabled so that each task is placed in its own process group,
+    which means it receives signals normally (background jobs otherwise ignore SIGINT).
+    Task <stdout> and <stderr> are redirected to duplicates of the `stdout` and `stderr` file
+    descriptors unless individual paths are given; the shell's own output is discarded.
+    """
+
+    process: Popen
+    pool: Optional[ShellPool]
+    current: Optional[ShellProcess]
+    control: int
+    buffer: bytes
+    fd_control: int
+    fd_output: int
+    fd_errors: int
+
+    def __init__(self: ShellWorker, stdout: IO = None, stderr: IO = None,
+                 env: Dict[str, str] = None, cwd: str = None, pool: ShellPool = None) -> None:
+        """Start shell process."""
+        if SHELL is None:
+            raise RuntimeError('Shell workers require bash on a POSIX platform')
+        self.pool = pool
+        self.current = None
+        self.control, self.fd_control = os.pipe()
+        self.fd_output = os.dup((stdout or sys.stdout).fileno())
+        self.fd_errors = os.dup((stderr or sys.stderr).fileno())
+        try:
+            self.process = Popen([SHELL, '-s'], stdin=PIPE, stdout=DEVNULL, stderr=DEVNULL,
+                                 pass_fds=(self.fd_control, self.fd_output, self.fd_errors),
+                                 env=env, cwd=cwd, start_new_session=True)
+        finally:
+            for fd in (self.fd_control, self.fd_output, self.fd_errors):
+                os.close(fd)
+        self.buffer = b''
+        self.send('set -m\n')
+        log.trace(f'Started shell worker (pid={self.process.pid})')
+
+    def send(self: ShellWorker, script: str) -> None:
+        """Write `script` to shell <stdin>."""
+        self.process.stdin.write(script.encode())
+        self.process.stdin.flush()
+
+    def run(self: ShellWorker, command: str, env: Dict[str, str] = None,
+            outpath: str = None, errpath: str = None) -> ShellProcess:
+        """Start `command` as a background job with `env` exported and return handle."""
+        exports = ' '.join(f'{key}={shlex.quote(value)}' for key, value in (env or {}).items()
+                           if VALID_NAME.match(key))
+        prefix = f'export {exports} && ' if exports else ''
+        output = f'>{shlex.quote(outpath)}' if outpath else f'>&{self.fd_output}'
+        errors = f'2>{shlex.quote(errpath)}' if errpath else f'2>&{self.fd_errors}'
+        self.send(f'( {prefix}eval {shlex.quote(command)} ) </dev/null {output} {errors} '
+                  f'{self.fd_control}>&- {self.fd_output}>&- {self.fd_errors}>&- &\n'
+                  f'echo "$!" >&{self.fd_control}\n'
+                  f'wait "$!"; echo "$?" >&{self.fd_control}\n')
+        self.current = ShellProcess(worker=self, pid=int(self.read_line(timeout=None)))
+        return self.current
+
+    def wait_ready(self: ShellWorker, timeout: float = None) -> bool:
+        """Round-trip a no-op through the shell to ensure it has started and is reading commands."""
+        self.send(f'echo READY >&{self.fd_control}\n')
+        return self.read_line(timeout=timeout) == 'READY'
+
+    def read_status(self: ShellWorker, timeout: Optional[float] = 0) -> Optional[int]:
+        """Exit status of current task if reported within `timeout` seconds, otherwise None."""
+        line = self.read_line(timeout=timeout)
+        return None if line is None else int(line)
+
+    def read_line(self: ShellWorker, timeout: Optional[float]) -> Optional[str]:
+        """Read next line from control pipe, waiting up to `timeout` seconds."""
+        while b'\n' not in self.buffer:
+            ready, _, _ = select.select([self.control, ], [], [], timeout)
+            if not ready:
+                return None
+            data = os.read(self.control, 1024)
+            if not data:
+                raise RuntimeError(f'Shell worker exited unexpectedly (pid={self.process.pid})')
+            self.buffer += data
+        line, self.buffer = self.buffer.split(b'\n', 1)
+        return line.decode()
+
+    def release(self: ShellWorker) -> None:
+        """Return to pool (if any) once current task has completed."""
+        self.current = None
+        if self.pool is not None:
+            self.pool.release(self)
+
+    def alive(self: ShellWorker) -> bool:
+        """Check if shell process is still running."""
+        return self.process.poll() is None
+
+    def running(self: ShellWorker) -> Optional[ShellProcess]:
+        """Current task if it has not yet been found to be complete."""
+        current = self.current
+        return current if current is not None and current.returncode is None else None
+
+    def close(self: ShellWorker, timeout: float = None) -> None:
+        """Close <stdin> to shell (exits once current job completes), wait, and close control pipe."""
+        try:
+            self.process.stdin.close()
+        except OSError:
+            pass
+        try:
+            self.process.wait(timeout=timeout)
+        except TimeoutExpired:
+            log.warning(f'Killing shell worker (pid={self.process.pid})')
+            self.process.kill()
+            self.process.wait()
+        os.close(self.control)
+
+
+class ShellPool:
+    """
+    Shared collection of idle shell workers.
+
+    Workers are started on demand by :meth:`run` and return to the pool once their current
+    task is found to be complete. Each task runs in its own process group (outside the session
+    of the caller), so :meth:`close` must be called to signal tasks that are still running.
+    """
+
+    stdout: Optional[IO]
+    stderr: Optional[IO]
+    env: Optional[Dict[str, str]]
+    cwd: Optional[str]
+
+    workers: List[ShellWorker]
+    idle: List[ShellWorker]
+    lock: Lock
+    closed: bool
+
+    def __init__(self: ShellPool, stdout: IO = None, stderr: IO = None,
+                 env: Dict[str, str] = None, cwd: str = None) -> None:
+        """Initialize with parameters for new workers."""
+        self.stdout = stdout
+        self.stderr = stderr
+        self.env = env
+        self.cwd = cwd
+        self.workers = []
+        self.idle = []
+        self.lock = Lock()
+        self.closed = False
+
+    def acquire(self: ShellPool) -> ShellWorker:
+        """Take an idle worker from the pool or start a new one."""
+        with self.lock:
+            if self.closed:
+                raise RuntimeError('Shell pool is closed')
+            while self.idle:
+                worker = self.idle.pop()
+                if worker.alive():
+                    return worker
+                self.workers.remove(worker)
+                worker.close()
+            worker = ShellWorker(stdout=self.stdout, stderr=self.stderr, env=self.env, cwd=self.cwd, pool=self)
+            self.workers.append(worker)
+            return worker
+
+    def warmup(self: ShellPool, timeout: float = 10) -> None:
+        """Start a new worker ahead of time and add it to the pool once ready."""
+        worker = ShellWorker(stdout=self.stdout, stderr=self.stderr, env=self.env, cwd=self.cwd, pool=self)
+        with self.lock:
+            self.workers.append(worker)
+        if worker.wait_ready(timeout=timeout):
+            self.release(worker)
+        else:
+            log.warning(f'Shell worker not ready after {timeout} seconds (pid={worker.process.pid})')
+            with self.lock:
+                self.workers.remove(worker)
+            worker.close(timeout=0)
+
+    def release(self: ShellPool, worker: ShellWorker) -> None:
+        """Return `worker` to the pool."""
+        with self.lock:
+            self.idle.append(worker)
+
+    def run(self: ShellPool, command: str, env: Dict[str, str] = None,
+            outpath: str = None, errpath: str = None) -> ShellProcess:
+        """Start `command` on an idle worker (see :meth:`ShellWorker.run`)."""
+        return self.acquire().run(command, env=env, outpath=outpath, errpath=errpath)
+
+    def close(self: ShellPool, signalwait: float = 2) -> None:
+        """
+        Shutdown all workers. Running tasks are sent SIGTERM and then SIGKILL if they have not
+        exited after `signalwait` seconds.
+        """
+        with self.lock:
+            if self.closed:
+                return
+            self.closed = True
+            workers = list(self.workers)
+            self.workers.clear()
+            self.idle.clear()
+        running = [process for worker in workers if (process := worker.running())]
+        for process in running:
+            log.warning(f'Terminating task (pid={process.pid})')
+            process.terminate()
+        deadline = time.monotonic() + signalwait
+        while running and time.monotonic() < deadline:
+            running = [process for process in running if process_group_exists(process.pid)]
+            if running:
+                time.sleep(0.05)
+        for process in running:
+            log.warning(f'Killing task (pid={process.pid})')
+            process.kill()
+        for worker in workers:
+            worker.close(timeout=signalwait)
+
+
+def process_group_exists(pgid: int) -> bool:
+    """Check if any process remains in process group `pgid`."""
+    try:
+        os.killpg(pgid, 0)
+        return True
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+
+
+class ChildWatcher:
+    """
+    Wait on exit of many child processes from a single thread.
+
+    Each registered PID is opened as a process file descriptor and watched with `epoll`,
+    which becomes readable once the process exits. The process is *not* reaped here (that would
+    lose the exit status for the owning :class:`subprocess.Popen`); the owner is expected to call
+    `poll()` once notified. Only available on Linux (see :meth:`supported`).
+
+    Example:
+        >>> watcher = ChildWatcher()
+        >>> process = Popen(['sleep', '1'])
+        >>> watcher.register(process.pid).wait()
+        True
+        >>> process.poll()
+        0
+    """
+
+    epoll: select.epoll
+    watched: Dict[int, Event]
+    lock: Lock
+    thread: Optional[Thread]
+    stopped: Event
+
+    def __init__(self: ChildWatcher) -> None:
+        """Initialize watcher (thread starts on first registration)."""
+        self.epoll = select.epoll()
+        self.watched = {}
+        self.lock = Lock()
+        self.thread = None
+        self.stopped = Event()
+
+    @staticmethod
+    def supported() -> bool:
+        """Check for process file descriptor support (Linux 5.3+)."""
+        try:
+            os.close(os.pidfd_open(os.getpid()))
+            return True
+        except (AttributeError, OSError):
+            return False
+
+    def register(self: ChildWatcher, pid: int) -> Event:
+        """Watch process `pid` and return event set when it exits."""
+        event = Event()
+        try:
+            fd = os.pidfd_open(pid)
+        except ProcessLookupError:
+            event.set()  # NOTE: already exited and reaped
+            return event
+        with self.lock:
+            if self.stopped.is_set():
+                os.close(fd)  # NOTE: never set, owner falls back to polling on its own timeout
+                return event
+            self.watched[fd] = event
+            self.epoll.register(fd, select.EPOLLIN)
+            if self.thread is None:
+                self.thread = Thread(target=self.run, name='hypershell-child-watcher', daemon=True)
+                self.thread.start()
+        return event
+
+    def run(self: ChildWatcher) -> None:
+        """Notify exited processes until stopped."""
+        while not self.stopped.is_set():
+            for fd, _ in self.epoll.poll(timeout=1):
+                with self.lock:
+                    event = self.watched.pop(fd)
+                    self.epoll.unregister(fd)
+                os.close(fd)
+                event.set()
+
+    def stop(self: ChildWatcher) -> None:
+        """Stop watching and release resources."""
+        self.stopped.set()
+        if self.thread is not None:
+            self.thread.join()
+        with self.lock:
+            for fd in self.watched:
+                os.close(fd)
+            self.watched.clear()
+            self.epoll.close()
@@ -6,10 +6,13 @@
 
 # type annotations
 from __future__ import annotations
-from typing import Dict, List, Callable, Union, Optional, Any, Iterable, Type
+from typing import Dict, Callable, Union, Optional, Any, Iterable, Type
 from types import TracebackType
 
 # standard libs
+import time
+import zlib
+import socket
 from multiprocessing.managers import BaseManager
 from multiprocessing import JoinableQueue
 from abc import ABC, abstractmethod
@@ -19,7 +22,7 @@ from dataclasses import dataclass
 from hypershell.core.config import default, config as _config
 
 # public interface
-__all__ = ['QueueConfig', 'QueueInterface', 'QueueServer', 'QueueClient']
+__all__ = ['QueueConfig', 'QueueInterface', 'QueueServer', 'QueueClient', 'wait_for_port']
 
 
 @dataclass
@@ -30,6 +33,7 @@ class QueueConfig:
     port: int = default.server.port
     auth: str = default.server.auth
     size: int = default.server.queuesize
+    compress: bool = False
 
     @classmethod
     def from_dict(cls, data: Dict[str, Union[str, int]]) -> QueueConfig:
@@ -44,6 +48,7 @@ class QueueConfig:
             'port': _config.server.port,
             'auth': _config.server.auth,
             'size': _config.server.queuesize,
+            'compress': _config.server.compress,
         })
 
 
@@ -51,8 +56,8 @@ class QueueInterface(BaseManager, ABC):
     """The queue interface provides access to three managed distributed queues."""
 
     config: QueueConfig
-    scheduled: JoinableQueue[Optional[List[bytes]]]
-    completed: JoinableQueue[Optional[List[bytes]]]
+    scheduled: JoinableQueue[Optional[bytes]]
+    completed: JoinableQueue[Optional[bytes]]
     heartbeat: JoinableQueue[Optional[bytes]]
     confirmed: JoinableQueue[Optional[bytes]]
 
@@ -66,6 +71,17 @@ class QueueInterface(BaseManager, ABC):
         """Create new interface from global configuration."""
         return cls(config=QueueConfig.load())
 
+    def encode(self: QueueInterface, data: bytes) -> bytes:
+        """Prepare bundle `data` to put on queue (compressed if enabled)."""
+        return zlib.compress(data, level=1) if self.config.compress else data
+
+    @staticmethod
+    def decode(data: bytes) -> bytes:
+        """Restore bundle `data` taken from queue (decompressed if necessary)."""
+        # NOTE: bundles are JSON objects ('{'), a zlib stream always begins with 0x78 ('x'),
+        # so either side may enable compression independently
+        return zlib.decompress(data) if data[:1] == b'x' else data
+
     @abstractmethod
     def __enter__(self: QueueInterface) -> QueueInterface:
         """Start server or connect from client."""
@@ -95,10 +111,10 @@ class QueueServer(QueueInterface):
         self.register('_get_confirmed', callable=self._get_confirmed)
         super().start()
 
-    def _get_scheduled(self: QueueServer) -> JoinableQueue[Optional[List[bytes]]]:
+    def _get_scheduled(self: QueueServer) -> JoinableQueue[Optional[bytes]]:
         return self.scheduled
 
-    def _get_completed(self: QueueServer) -> JoinableQueue[Optional[List[bytes]]]:
+    def _get_completed(self: QueueServer) -> JoinableQueue[Optional[bytes]]:
         return self.completed
 
     def _get_heartbeat(self: QueueServer) -> JoinableQueue[Optional[bytes]]:
@@ -123,8 +139,8 @@ class QueueServer(QueueInterface):
 class QueueClient(QueueInterface):
     """Client connection to queue manager."""
 
-    _get_scheduled: Callable[[], JoinableQueue[Optional[List[bytes]]]]
-    _get_completed: Callable[[], JoinableQueue[Optional[List[bytes]]]]
+    _get_scheduled: Callable[[], JoinableQueue[Optional[bytes]]]
+    _get_completed: Callable[[], JoinableQueue[Optional[bytes]]]
     _get_heartbeat: Callable[[], JoinableQueue[Optional[bytes]]]
     _get_confirmed: Callable[[], JoinableQueue[Optional[bytes]]]
 
@@ -150,3 +166,18 @@ class QueueClient(QueueInterface):
                  exc_val: Optional[Exception],
                  exc_tb: Optional[TracebackType]) -> None:
         """Disconnect from server."""
+
+
+def wait_for_port(host: str, port: int, timeout: float = 10) -> bool:
+    """Wait until (`host`, `port`) accepts TCP connections (returns False if `timeout` expires)."""
+    if host in ('0.0.0.0', ''):
+        host = '127.0.0.1'  # NOTE: wildcard bind address is reachable on loopback
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            with socket.create_connection((host, port), timeout=0.05):
+                return True
+        except OSError:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.01)
@@ -0,0 +1,131 @@
+# SPDX-FileCopyrightText: 2024 Geoffrey Lentner
+# SPDX-License-Identifier: Apache-2.0
+
+"""Bounded ring buffer queue for passing tasks between local threads."""
+
+
+# type annotations
+from __future__ import annotations
+from typing import List, Optional, TypeVar, Generic
+
+# standard libs
+from threading import Lock, Condition
+from queue import Empty, Full
+
+# public interface
+__all__ = ['RingQueue', ]
+
+
+T = TypeVar('T')
+
+
+class RingQueue(Generic[T]):
+    """
+    Bounded FIFO queue over a preallocated ring buffer.
+
+    Provides the subset of the :class:`queue.Queue` interface used between local threads
+    (`put`, `get`, `put_nowait`, `get_nowait`, `qsize`, `empty`, `full`) and raises the same
+    :class:`queue.Full` and :class:`queue.Empty` exceptions. Use `get_many` to remove several
+    items under a single lock acquisition. There is no `task_done` or `join` accounting.
+    The buffer is sized to the next power of two so that indices wrap with a bit mask instead
+    of a modulus, and a single lock guards both ends.
+
+    Example:
+        >>> queue = RingQueue(maxsize=4)
+        >>> queue.put('a')
+        >>> queue.get()
+        'a'
+    """
+
+    maxsize: int
+
+    _buffer: List[Optional[T]]
+    _mask: int
+    _head: int
+    _tail: int
+    _lock: Lock
+    _not_empty: Condition
+    _not_full: Condition
+
+    def __init__(self: RingQueue, maxsize: int = 1) -> None:
+        """Initialize buffer with capacity for `maxsize` items."""
+        if maxsize < 1:
+            raise ValueError(f'RingQueue requires positive maxsize (given {maxsize})')
+        self.maxsize = maxsize
+        capacity = 1 << (maxsize - 1).bit_length()
+        self._buffer = [None] * capacity
+        self._mask = capacity - 1
+        self._head = 0  # NOTE: running count of items removed
+        self._tail = 0  # NOTE: running count of items added
+        self._lock = Lock()
+        self._not_empty = Condition(self._lock)
+        self._not_full = Condition(self._lock)
+
+    def qsize(self: RingQueue) -> int:
+        """Approximate number of items in the queue."""
+        return self._tail - self._head
+
+    def empty(self: RingQueue) -> bool:
+        """True if queue is (approximately) empty."""
+        return self._tail == self._head
+
+    def full(self: RingQueue) -> bool:
+        """True if queue is (approximately) full."""
+        return self._tail - self._head >= self.maxsize
+
+    def _has_items(self: RingQueue) -> bool:
+        return self._tail != self._head
+
+    def _has_space(self: RingQueue) -> bool:
+        return self._tail - self._head < self.maxsize
+
+    def put(self: RingQueue, item: T, block: bool = True, timeout: float = None) -> None:
+        """Put `item` on the queue, waiting up to `timeout` seconds for a free slot."""
+        with self._not_full:
+            if not self._has_space():
+                if not block or not self._not_full.wait_for(self._has_space, timeout):
+                    raise Full
+            self._buffer[self._tail & self._mask] = item
+            self._tail += 1
+            self._not_empty.notify()
+
+    def get(self: RingQueue, block: bool = True, timeout: float = None) -> T:
+        """Remove and return the next item, waiting up to `timeout` seconds for one."""
+        with self._not_empty:
+            if not self._has_items():
+                if not block or not self._not_empty.wait_for(self._has_items, timeout):
+                    raise Empty
+            index = self._head & self._mask
+            item = self._buffer[index]
+            self._buffer[index] = None  # NOTE: release reference
+            self._head += 1
+            self._not_full.notify()
+            return item
+
+    def get_many(self: RingQueue, count: int, block: bool = True, timeout: float = None) -> List[T]:
+        """
+        Remove and return up to `count` items (at least one).
+        Waits up to `timeout` seconds for the first item.
+        """
+        with self._not_empty:
+            if not self._has_items():
+                if not block or not self._not_empty.wait_for(self._has_items, timeout):
+                    raise Empty
+            items = []
+            head = self._head
+            for _ in range(min(count, self._tail - head)):
+                index = head & self._mask
+                items.append(self._buffer[index])
+                self._buffer[index] = None  # NOTE: release reference
+                head += 1
+            self._head = head
+            self._not_full.notify(len(items))
+            return items
+
+    def put_nowait(self: RingQueue, item: T) -> None:
+        """Put `item` on the queue without blocking."""
+        self.put(item, block=False)
+
+    def get_nowait(self: RingQueue) -> T:
+        """Remove and return the next item without blocking."""
+        return self.get(block=False)
@@ -0,0 +1,147 @@
+# SPDX-FileCopyrightText: 2024 Geoffrey Lentner
+# SPDX-License-Identifier: Apache-2.0
+
+"""Work-stealing queue for dispatching tasks to local executor threads."""
+
+
+# type annotations
+from __future__ import annotations
+from typing import List, Iterable, Optional, Tuple, TypeVar, Generic
+
+# standard libs
+import time
+from collections import deque
+from itertools import islice
+from threading import Lock, Condition
+from queue import Empty, Full
+
+# public interface
+__all__ = ['StealingQueue', ]
+
+
+T = TypeVar('T')
+
+
+class StealingQueue(Generic[T]):
+    """
+    Bounded set of per-worker FIFO queues with work stealing.
+
+    Items are distributed round-robin by `put_many`. Each worker takes from the front of its own
+    queue and, if that is empty, steals from the back of the others. Taking an item does not
+    acquire a lock (single `deque` operations are atomic); the lock is only needed to block when
+    all queues are empty, or for the producer to wait on space. Once `close` is called, workers
+    receive None after all queues are drained (instead of one sentinel per worker).
+
+    Example:
+        >>> queue = StealingQueue(workers=2, maxsize=4)
+        >>> queue.put_many(['a', 'b', 'c'])
+        3
+        >>> queue.get(worker=1)
+        'b'
+        >>> queue.get(worker=1)  # steal from worker 0
+        'c'
+    """
+
+    maxsize: int
+    queues: List[deque[T]]
+
+    _next: int
+    _closed: bool
+    _waiting_space: bool
+    _lock: Lock
+    _not_empty: Condition
+    _not_full: Condition
+
+    def __init__(self: StealingQueue, workers: int, maxsize: int = 1) -> None:
+        """Initialize queues for `workers` with total capacity of `maxsize` items."""
+        if workers < 1 or maxsize < 1:
+            raise ValueError(f'StealingQueue requires positive workers and maxsize (given {workers}, {maxsize})')
+        self.maxsize = maxsize
+        self.queues = [deque() for _ in range(workers)]
+        self._next = 0
+        self._closed = False
+        self._waiting_space = False
+        self._lock = Lock()
+        self._not_empty = Condition(self._lock)
+        self._not_full = Condition(self._lock)
+
+    def qsize(self: StealingQueue) -> int:
+        """Approximate number of items across all queues."""
+        return sum(len(queue) for queue in self.queues)
+
+    def empty(self: StealingQueue) -> bool:
+        """True if all queues are (approximately) empty."""
+        return not any(self.queues)
+
+    def put_many(self: StealingQueue, items: Iterable[T], block: bool = True, timeout: float = None) -> int:
+        """
+        Distribute leading `items` across queues while there is space and return how many were added.
+        Waits up to `timeout` seconds for at least one free slot.
+        """
+        with self._lock:
+            if self._closed:
+                raise ValueError('StealingQueue is closed')
+            if self.qsize() >= self.maxsize:
+                if not block or not self._wait_space(1, timeout):
+                    raise Full
+            count = 0
+            for item in islice(items, self.maxsize - self.qsize()):
+                self.queues[self._next].append(item)
+                self._next = (self._next + 1) % len(self.queues)
+                count += 1
+            self._not_empty.notify(count)
+            return count
+
+    def wait_space(self: StealingQueue, count: int = 1, timeout: float = None) -> bool:
+        """Wait up to `timeout` seconds for at least `count` free slots (returns False if expired)."""
+        with self._lock:
+            return self._wait_space(count, timeout)
+
+    def _wait_space(self: StealingQueue, count: int, timeout: Optional[float]) -> bool:
+        # NOTE: workers only take the lock to notify while a producer is waiting
+        self._waiting_space = True
+        try:
+            return self._not_full.wait_for(lambda: self.maxsize - self.qsize() >= count, timeout)
+        finally:
+            self._waiting_space = False
+
+    def _take(self: StealingQueue, worker: int) -> Tuple[bool, Optional[T]]:
+        try:
+            return True, self.queues[worker].popleft()
+        except IndexError:
+            pass
+        count = len(self.queues)
+        for offset in range(1, count):
+            try:
+                return True, self.queues[(worker + offset) % count].pop()
+            except IndexError:
+                continue
+        return False, None
+
+    def get(self: StealingQueue, worker: int, block: bool = True, timeout: float = None) -> Optional[T]:
+        """
+        Take next item for `worker` (stealing if necessary), waiting up to `timeout` seconds.
+        Returns None if the queue is closed and no items remain.
+        """
+        found, item = self._take(worker)
+        if not found:
+            deadline = None if timeout is None else time.monotonic() + timeout
+            with self._lock:
+                while not (result := self._take(worker))[0]:
+                    if self._closed:
+                        return None
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if not block or (remaining is not None and remaining <= 0):
+                        raise Empty
+                    self._not_empty.wait(remaining)
+                item = result[1]
+        if self._waiting_space:
+            with self._lock:
+                self._not_full.notify()
+        return item
+
+    def close(self: StealingQueue) -> None:
+        """Signal workers to finish once all queues are drained."""
+        with self._lock:
+            self._closed = True
+            self._not_empty.notify_all()
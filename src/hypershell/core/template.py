@@ -74,6 +74,8 @@ class Template:
 
     def expand(self: Template, args: str) -> str:
         """Expand template against input `args`."""
+        if self.template == DEFAULT_TEMPLATE:
+            return args  # NOTE: fast path for the common case
         index = 0
         expansion = ''
         if not PATTERN.search(self.template):
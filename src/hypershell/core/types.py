@@ -5,23 +5,50 @@
 
 
 # type annotations
-from typing import TypeVar
+from typing import Union
+
+# standard libs
+import functools
 
 # public interface
 __all__ = ['smart_coerce', 'JSONValue']
 
 
 # Each possible input type
-JSONValue = TypeVar('JSONValue', bool, int, float, str, type(None))
+JSONValue = Union[bool, int, float, str, None]
+
+
+# Special names (lowercase) and their first character in any case
+_NULL_NAMES = frozenset(('null', 'none'))
+_TRUE_NAMES = frozenset(('true', ))
+_FALSE_NAMES = frozenset(('false', ))
+_SPECIAL_START = frozenset('nNtTfF')
 
+# ASCII characters that can start a value accepted by int() or float()
+# (digits, sign, decimal point, 'inf' or 'nan', and leading whitespace)
+_NUMERIC_START = frozenset('0123456789+-.iInN') | frozenset(c for c in map(chr, range(128)) if c.isspace())
 
+
+@functools.lru_cache(maxsize=4096)
 def smart_coerce(value: str) -> JSONValue:
-    """Automatically coerce string to typed value."""
-    cmp_val = value.lower()
-    if cmp_val in ('null', 'none'):
-        return None
-    if cmp_val in ('true', 'false'):
-        return cmp_val == 'true'
+    """Automatically coerce string to typed value (memoized, since values often repeat)."""
+    if value.isdecimal():
+        try:
+            return int(value)  # NOTE: fast path for plain integers (isdigit() would accept '²')
+        except ValueError:
+            pass  # NOTE: exceeds int max str digits (falls through to float)
+    # NOTE: only lowercase values that could be one of the special names (by length and first character)
+    if 4 <= len(value) <= 5 and value[0] in _SPECIAL_START:
+        cmp_val = value.lower()
+        if cmp_val in _NULL_NAMES:
+            return None
+        if cmp_val in _TRUE_NAMES:
+            return True
+        if cmp_val in _FALSE_NAMES:
+            return False
+    # NOTE: skip raising two exceptions for values that cannot be numeric (non-ASCII may be digits)
+    if value[:1] not in _NUMERIC_START and value[:1] < '\x80':
+        return value
     try:
         return int(value)
     except ValueError:
@@ -133,6 +133,23 @@ class Entity(DeclarativeBase):
         """Unpack raw JSON byte string."""
         return cls.from_json(json.loads(data.decode()))
 
+    @classmethod
+    def pack_many(cls: Type[Entity], items: List[Entity]) -> bytes:
+        """Encode many records together as a single raw JSON byte string (column-oriented)."""
+        rows = [item.to_tuple() for item in items]
+        return json.dumps({name: [to_json_type(value) for value in values]
+                           for name, values in zip(cls.columns, zip(*rows))}).encode()
+
+    @classmethod
+    def unpack_many(cls: Type[Entity], data: bytes) -> List[Entity]:
+        """Unpack many records from a single raw JSON byte string (column-oriented)."""
+        columns = json.loads(data.decode())
+        for name, values in columns.items():
+            # NOTE: decode by declared column type instead of guessing on every value
+            if cls.columns.get(name) is datetime:
+                columns[name] = [None if value is None else datetime.fromisoformat(value) for value in values]
+        return [cls.from_dict(dict(zip(columns, row))) for row in zip(*columns.values())]
+
     @classmethod
     def query(cls: Type[Entity], *fields: Column, caching: bool = True) -> Query:
         """Get query interface for entity with scoped session."""
@@ -64,7 +64,7 @@ from hypershell.core.config import config, default, find_available_ports
 from hypershell.core.logging import Logger
 from hypershell.core.fsm import State, StateMachine
 from hypershell.core.thread import Thread
-from hypershell.core.queue import QueueServer, QueueConfig
+from hypershell.core.queue import QueueServer, QueueConfig, wait_for_port
 from hypershell.core.signal import check_signal, SIGNAL_MAP, SIGUSR1, SIGUSR2
 from hypershell.core.heartbeat import Heartbeat, ClientState
 from hypershell.data.model import Task, Client
@@ -113,7 +113,7 @@ class Scheduler(StateMachine):
 
     tasks: List[Task]
     queue: QueueServer
-    bundle: List[bytes]
+    bundle: bytes
 
     bundlesize: int
     attempts: int
@@ -131,7 +131,7 @@ class Scheduler(StateMachine):
                  forever_mode: bool = False, restart_mode: bool = False) -> None:
         """Initialize queue and parameters."""
         self.queue = queue
-        self.bundle = []
+        self.bundle = b''
         self.bundlesize = bundlesize
         self.attempts = attempts
         self.eager = eager
@@ -186,8 +186,8 @@ class Scheduler(StateMachine):
             return SchedulerState.LOAD
 
     def pack_bundle(self: Scheduler) -> SchedulerState:
-        """Pack tasks into bundle (list)."""
-        self.bundle = [task.pack() for task in self.tasks]
+        """Pack tasks into bundle."""
+        self.bundle = self.queue.encode(Task.pack_many(self.tasks))
         return SchedulerState.POST
 
     def post_bundle(self: Scheduler) -> SchedulerState:
@@ -337,7 +337,7 @@ class Receiver(StateMachine):
 
     tasks: List[Task]
     queue: QueueServer
-    bundle: List[bytes]
+    bundle: Optional[bytes]
 
     in_memory: bool
     redirect_failures: IO
@@ -348,7 +348,7 @@ class Receiver(StateMachine):
     def __init__(self: Receiver, queue: QueueServer, in_memory: bool = False, redirect_failures: IO = None) -> None:
         """Initialize receiver."""
         self.queue = queue
-        self.bundle = []
+        self.bundle = b''
         self.in_memory = in_memory
         self.redirect_failures = redirect_failures
 
@@ -380,7 +380,7 @@ class Receiver(StateMachine):
 
     def unpack_bundle(self: Receiver) -> ReceiverState:
         """Unpack previous bundle into list of tasks."""
-        self.tasks = [Task.unpack(data) for data in self.bundle]
+        self.tasks = Task.unpack_many(self.queue.decode(self.bundle))
         return ReceiverState.UPDATE
 
     def update_tasks(self: Receiver) -> ReceiverState:
@@ -713,7 +713,8 @@ class ServerThread(Thread):
             self.in_memory = True
         if self.in_memory and max_retries > 0:
             log.warning('Retries disabled when database disabled')
-        queue_config = QueueConfig(host=address[0], port=address[1], auth=auth, size=config.server.queuesize)
+        queue_config = QueueConfig(host=address[0], port=address[1], auth=auth, size=config.server.queuesize,
+                                   compress=config.server.compress)
         self.queue = QueueServer(config=queue_config)
         if self.in_memory:
             self.scheduler = None
@@ -744,6 +745,11 @@ class ServerThread(Thread):
             self.wait_confirm()
         log.debug('Done')
 
+    def wait_ready(self: ServerThread, timeout: float = 10) -> None:
+        """Wait until queue server accepts connections (continue with warning after `timeout` seconds)."""
+        if not wait_for_port(self.queue.config.host, self.queue.config.port, timeout=timeout):
+            log.warning(f'Server not ready after {timeout} seconds')
+
     def start_threads(self: ServerThread) -> None:
         """Start child threads."""
         if self.submitter is not None:
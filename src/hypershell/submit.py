@@ -384,7 +384,7 @@ class QueueCommitter(StateMachine):
     client: QueueClient
 
     tasks: List[Task]
-    bundle: List[bytes]
+    bundle: bytes
 
     bundlesize: int
     bundlewait: int
@@ -399,7 +399,7 @@ class QueueCommitter(StateMachine):
         self.local = local
         self.client = client
         self.tasks = []
-        self.bundle = []
+        self.bundle = b''
         self.bundlesize = bundlesize
         self.bundlewait = bundlewait
 
@@ -438,7 +438,7 @@ class QueueCommitter(StateMachine):
     def pack_bundle(self: QueueCommitter) -> QueueCommitterState:
         """Pack tasks into bundle for remote queue."""
         if self.tasks:
-            self.bundle = [task.pack() for task in self.tasks]
+            self.bundle = self.client.encode(Task.pack_many(self.tasks))
             return QueueCommitterState.COMMIT
         else:
             return QueueCommitterState.GET
@@ -451,7 +451,7 @@ class QueueCommitter(StateMachine):
                 for task in self.tasks:
                     log.trace(f'Scheduled task ({task.id})')
                 self.tasks = []
-                self.bundle = []
+                self.bundle = b''
                 self.previous_submit = datetime.now()
             return QueueCommitterState.GET
         except QueueFull:
@@ -0,0 +1,86 @@
+# SPDX-FileCopyrightText: 2024 Geoffrey Lentner
+# SPDX-License-Identifier: Apache-2.0
+
+"""Unit tests for finite state machine base class."""
+
+
+# type annotations
+from __future__ import annotations
+from typing import Dict, Callable
+
+# standard libs
+import functools
+from enum import Enum
+
+# external libs
+import pytest
+
+# internal libs
+from hypershell.core.fsm import State, StateMachine
+
+
+class CounterState(State, Enum):
+    """Finite states for counter machine."""
+    START = 0
+    COUNT = 1
+    HALT = 2
+
+
+class Counter(StateMachine):
+    """Count up to a limit (or fail at a given count)."""
+
+    count: int
+    limit: int
+    fail_at: int
+    halt_at: int
+
+    state = CounterState.START
+    states = CounterState
+
+    def __init__(self: Counter, limit: int, fail_at: int = None, halt_at: int = None) -> None:
+        self.count = 0
+        self.limit = limit
+        self.fail_at = fail_at
+        self.halt_at = halt_at
+
+    @functools.cached_property
+    def actions(self: Counter) -> Dict[CounterState, Callable[[], CounterState]]:
+        return {
+            CounterState.START: self.start,
+            CounterState.COUNT: self.increment,
+        }
+
+    @staticmethod
+    def start() -> CounterState:
+        return CounterState.COUNT
+
+    def increment(self: Counter) -> CounterState:
+        self.count += 1
+        if self.count == self.fail_at:
+            raise RuntimeError(f'Failed at {self.count}')
+        if self.count == self.halt_at:
+            self.halt()
+        return CounterState.COUNT if self.count < self.limit else CounterState.HALT
+
+
+class TestStateMachine:
+    """Unit tests for `StateMachine`."""
+
+    def test_run(self) -> None:
+        machine = Counter(limit=10)
+        machine.run()
+        assert machine.count == 10
+        assert machine.state is CounterState.HALT
+
+    def test_halt(self) -> None:
+        machine = Counter(limit=10, halt_at=3)
+        machine.run()
+        assert machine.count == 3
+        assert machine.state is CounterState.HALT
+
+    def test_exception(self) -> None:
+        machine = Counter(limit=10, fail_at=5)
+        with pytest.raises(RuntimeError):
+            machine.run()
+        assert machine.count == 5
+        assert machine.state is CounterState.COUNT
@@ -0,0 +1,102 @@
+# SPDX-FileCopyrightText: 2024 Geoffrey Lentner
+# SPDX-License-Identifier: Apache-2.0
+
+"""Unit tests for shell worker pool."""
+
+
+# standard libs
+import os
+import time
+from signal import SIGINT
+from subprocess import Popen
+
+# external libs
+import pytest
+
+# internal libs
+from hypershell.core.process import ShellPool, ChildWatcher, SHELL, split_command
+
+
+@pytest.mark.skipif(SHELL is None, reason='Requires bash on a POSIX platform')
+class TestShellPool:
+    """Unit tests for `ShellPool`."""
+
+    def test_exit_status(self) -> None:
+        pool = ShellPool()
+        try:
+            assert pool.run('true').wait(timeout=5) == 0
+            assert pool.run('exit 3').wait(timeout=5) == 3
+            assert len(pool.workers) == 1
+        finally:
+            pool.close()
+
+    def test_warmup(self) -> None:
+        pool = ShellPool()
+        try:
+            pool.warmup()
+            worker, = pool.idle
+            assert pool.run('true').worker is worker
+        finally:
+            pool.close()
+
+    def test_env_and_capture(self, tmp_path) -> None:
+        outpath, errpath = str(tmp_path / 'task.out'), str(tmp_path / 'task.err')
+        pool = ShellPool()
+        try:
+            process = pool.run('echo "$TASK_ARGS"; echo oops >&2', env={'TASK_ARGS': 'a \'b\' $c'},
+                               outpath=outpath, errpath=errpath)
+            assert process.wait(timeout=5) == 0
+        finally:
+            pool.close()
+        with open(outpath) as stream:
+            assert stream.read() == 'a \'b\' $c\n'
+        with open(errpath) as stream:
+            assert stream.read() == 'oops\n'
+
+    def test_send_signal(self) -> None:
+        pool = ShellPool()
+        try:
+            process = pool.run('sleep 10')
+            time.sleep(0.1)
+            assert process.poll() is None
+            process.send_signal(SIGINT)
+            assert process.wait(timeout=5) == -SIGINT
+        finally:
+            pool.close()
+
+    def test_close_terminates_running(self) -> None:
+        pool = ShellPool()
+        process = pool.run('sleep 30')
+        time.sleep(0.1)
+        start = time.monotonic()
+        pool.close(signalwait=5)
+        assert time.monotonic() - start < 5
+        with pytest.raises(ProcessLookupError):
+            os.killpg(process.pid, 0)
+        with pytest.raises(RuntimeError):
+            pool.run('true')
+
+
+@pytest.mark.skipif(not ChildWatcher.supported(), reason='Requires pidfd support (Linux)')
+def test_child_watcher() -> None:
+    watcher = ChildWatcher()
+    try:
+        fast, slow = Popen(['sleep', '0']), Popen(['sleep', '10'])
+        fast_exited, slow_exited = watcher.register(fast.pid), watcher.register(slow.pid)
+        assert fast_exited.wait(timeout=5) and fast.poll() == 0
+        assert not slow_exited.is_set()
+        slow.kill()
+        assert slow_exited.wait(timeout=5) and slow.poll() == -9
+    finally:
+        watcher.stop()
+
+
+@pytest.mark.skipif(os.name != 'posix', reason='Requires POSIX platform')
+def test_split_command() -> None:
+    executable, argv = split_command('sleep \'1 2\' 3')
+    assert executable.endswith('sleep')
+    assert argv == ['sleep', '1 2', '3']
+    for command in ['echo hello', 'printf x', 'pwd', 'test -f x', 'kill %1', 'true',  # builtins
+                    'echo $HOME', 'ls *.py', 'echo a > b', 'true && false', 'A=1 env', 'exit 3',
+                    './script.sh', 'echo "unterminated', 'not-a-real-program-xyz']:
+        assert split_command(command) is None
@@ -0,0 +1,30 @@
+# SPDX-FileCopyrightText: 2024 Geoffrey Lentner
+# SPDX-License-Identifier: Apache-2.0
+
+"""Unit tests for queue server/client helpers."""
+
+
+# standard libs
+import socket
+
+# internal libs
+from hypershell.core.queue import QueueClient, QueueConfig, wait_for_port
+
+
+def test_wait_for_port() -> None:
+    with socket.socket() as server:
+        server.bind(('127.0.0.1', 0))
+        server.listen()
+        host, port = server.getsockname()
+        assert wait_for_port(host, port, timeout=1)
+    assert not wait_for_port(host, port, timeout=0.05)
+
+
+def test_encode_decode() -> None:
+    data = b'{"args": ["echo 1", "echo 2", "echo 3"]}'
+    plain = QueueClient(config=QueueConfig(compress=False))
+    compressed = QueueClient(config=QueueConfig(compress=True))
+    assert plain.encode(data) == data
+    assert compressed.encode(data) != data
+    assert plain.decode(compressed.encode(data)) == data
+    assert compressed.decode(plain.encode(data)) == data
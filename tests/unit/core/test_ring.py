@@ -0,0 +1,76 @@
+# SPDX-FileCopyrightText: 2024 Geoffrey Lentner
+# SPDX-License-Identifier: Apache-2.0
+
+"""Unit tests for ring buffer queue."""
+
+
+# standard libs
+from queue import Empty, Full
+from threading import Thread
+
+# external libs
+import pytest
+
+# internal libs
+from hypershell.core.ring import RingQueue
+
+
+class TestRingQueue:
+    """Unit tests for `RingQueue`."""
+
+    def test_invalid_maxsize(self) -> None:
+        with pytest.raises(ValueError):
+            RingQueue(maxsize=0)
+
+    def test_fifo_order_with_wrap(self) -> None:
+        queue = RingQueue(maxsize=3)
+        result = []
+        for i in range(10):
+            queue.put(i)
+            queue.put(i + 100)
+            result.append(queue.get())
+            result.append(queue.get())
+        assert result == [value for i in range(10) for value in (i, i + 100)]
+        assert queue.empty()
+
+    def test_bounded(self) -> None:
+        queue = RingQueue(maxsize=3)
+        for i in range(3):
+            queue.put_nowait(i)
+        assert queue.full() and queue.qsize() == 3
+        with pytest.raises(Full):
+            queue.put_nowait(3)
+        with pytest.raises(Full):
+            queue.put(3, timeout=0.01)
+
+    def test_get_many(self) -> None:
+        queue = RingQueue(maxsize=4)
+        for item in ['a', 'b', 'c']:
+            queue.put(item)
+        assert queue.get_many(2) == ['a', 'b']
+        assert queue.get_many(5) == ['c', ]
+        with pytest.raises(Empty):
+            queue.get_many(2, timeout=0.01)
+
+    def test_empty(self) -> None:
+        queue = RingQueue(maxsize=2)
+        with pytest.raises(Empty):
+            queue.get_nowait()
+        with pytest.raises(Empty):
+            queue.get(timeout=0.01)
+
+    def test_threaded(self) -> None:
+        queue = RingQueue(maxsize=4)
+        count = 1000
+        received = []
+
+        def consume() -> None:
+            for _ in range(count):
+                received.append(queue.get(timeout=5))
+
+        consumer = Thread(target=consume)
+        consumer.start()
+        for i in range(count):
+            queue.put(i, timeout=5)
+        consumer.join()
+        assert received == list(range(count))
@@ -0,0 +1,89 @@
+# SPDX-FileCopyrightText: 2024 Geoffrey Lentner
+# SPDX-License-Identifier: Apache-2.0
+
+"""Unit tests for work-stealing queue."""
+
+
+# standard libs
+from queue import Empty, Full
+from threading import Thread
+
+# external libs
+import pytest
+
+# internal libs
+from hypershell.core.steal import StealingQueue
+
+
+class TestStealingQueue:
+    """Unit tests for `StealingQueue`."""
+
+    def test_invalid_arguments(self) -> None:
+        with pytest.raises(ValueError):
+            StealingQueue(workers=0, maxsize=4)
+        with pytest.raises(ValueError):
+            StealingQueue(workers=2, maxsize=0)
+
+    def test_own_queue_fifo(self) -> None:
+        queue = StealingQueue(workers=2, maxsize=6)
+        assert queue.put_many(['a', 'b', 'c', 'd']) == 4
+        assert queue.get(worker=0) == 'a'
+        assert queue.get(worker=0) == 'c'
+        assert queue.get(worker=1) == 'b'
+        assert queue.get(worker=1) == 'd'
+        assert queue.empty()
+
+    def test_steal_from_back(self) -> None:
+        queue = StealingQueue(workers=2, maxsize=6)
+        queue.put_many(['a', 'b', 'c', 'd', 'e'])
+        assert [queue.get(worker=1) for _ in range(2)] == ['b', 'd']
+        assert queue.get(worker=1) == 'e'  # stolen from worker 0
+        assert queue.get(worker=0) == 'a'
+        assert queue.get(worker=1) == 'c'
+
+    def test_bounded(self) -> None:
+        queue = StealingQueue(workers=3, maxsize=4)
+        assert queue.put_many(range(10)) == 4
+        assert queue.qsize() == 4
+        with pytest.raises(Full):
+            queue.put_many([4], timeout=0.01)
+        assert not queue.wait_space(1, timeout=0.01)
+        Thread(target=queue.get, args=(0, )).start()
+        assert queue.wait_space(1, timeout=5)
+
+    def test_empty(self) -> None:
+        queue = StealingQueue(workers=2, maxsize=2)
+        with pytest.raises(Empty):
+            queue.get(worker=0, block=False)
+        with pytest.raises(Empty):
+            queue.get(worker=0, timeout=0.01)
+
+    def test_close(self) -> None:
+        queue = StealingQueue(workers=2, maxsize=4)
+        queue.put_many(['a', 'b'])
+        queue.close()
+        assert {queue.get(worker=0), queue.get(worker=0)} == {'a', 'b'}
+        assert queue.get(worker=0) is None
+        assert queue.get(worker=1) is None
+        with pytest.raises(ValueError):
+            queue.put_many(['c'])
+
+    def test_threaded(self) -> None:
+        queue = StealingQueue(workers=4, maxsize=8)
+        count = 1000
+        received = [[] for _ in range(4)]
+
+        def consume(worker: int) -> None:
+            while (item := queue.get(worker, timeout=5)) is not None:
+                received[worker].append(item)
+
+        consumers = [Thread(target=consume, args=(worker, )) for worker in range(4)]
+        for thread in consumers:
+            thread.start()
+        items = list(range(count))
+        while items:
+            del items[:queue.put_many(items, timeout=5)]
+        queue.close()
+        for thread in consumers:
+            thread.join()
+        assert sorted(item for items in received for item in items) == list(range(count))
@@ -0,0 +1,38 @@
+# SPDX-FileCopyrightText: 2024 Geoffrey Lentner
+# SPDX-License-Identifier: Apache-2.0
+
+"""Unit tests for automatic type coercion."""
+
+
+# standard libs
+import math
+
+# external libs
+import pytest
+
+# internal libs
+from hypershell.core.types import smart_coerce
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('null', None), ('NULL', None), ('None', None),
+    ('true', True), ('TRUE', True), ('False', False),
+    ('1', 1), ('-5', -5), ('+5', 5), (' 7 ', 7), ('1_000', 1000), ('٣', 3),
+    ('1.5', 1.5), ('.5', 0.5), ('-1e3', -1000.0), ('inf', math.inf),
+    ('', ''), ('none ', 'none '), ('tru', 'tru'), ('abc', 'abc'), ('a/b.txt', 'a/b.txt'),
+    ('0x10', '0x10'), ('1.2.3', '1.2.3'), ('²', '²'), ('x1', 'x1'), ('\t5', 5),
+    ('1' * 5000, math.inf),
+])
+def test_smart_coerce(value: str, expected: object) -> None:
+    result = smart_coerce(value)
+    assert type(result) is type(expected) and result == expected
+
+
+def test_smart_coerce_nan() -> None:
+    assert math.isnan(smart_coerce('NaN'))
+
+
+def test_smart_coerce_cached() -> None:
+    smart_coerce.cache_clear()
+    assert smart_coerce('42') == smart_coerce('42') == 42
+    assert smart_coerce.cache_info().hits == 1
@@ -0,0 +1,39 @@
+# SPDX-FileCopyrightText: 2024 Geoffrey Lentner
+# SPDX-License-Identifier: Apache-2.0
+
+"""Unit tests for database model module."""
+
+
+# standard libs
+from datetime import datetime
+
+# internal libs
+from hypershell.data.model import Task
+
+
+class TestTaskPacking:
+    """Unit tests for `Task` serialization."""
+
+    def test_pack_unpack(self) -> None:
+        task = Task.new(args='echo AAA', tag={'group': 'a', 'index': 1})
+        other = Task.unpack(task.pack())
+        assert other.to_dict() == task.to_dict()
+
+    def test_pack_many_unpack_many(self) -> None:
+        tasks = [Task.new(args=f'echo {i}', tag={'index': i}) for i in range(10)]
+        tasks[0].exit_status = 0
+        tasks[0].start_time = datetime.now().astimezone()
+        others = Task.unpack_many(Task.pack_many(tasks))
+        assert len(others) == len(tasks)
+        for task, other in zip(tasks, others):
+            assert other.to_dict() == task.to_dict()
+
+    def test_pack_many_empty(self) -> None:
+        assert Task.unpack_many(Task.pack_many([])) == []
+
+    def test_pack_many_preserves_types(self) -> None:
+        task = Task.new(args='2024-01-01 00:00:00')
+        other, = Task.unpack_many(Task.pack_many([task, ]))
+        assert other.args == '2024-01-01 00:00:00'
+        assert isinstance(other.submit_time, datetime)
+        assert other.submit_time == task.submit_time